@@ -1,14 +1,26 @@
 import asyncio
 import logging
+import operator
 import os
 import pickle
 import random
 import shutil
+import threading
 from collections import defaultdict
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, ExitStack
-from functools import partial
 from types import TracebackType
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from langchain_core.runnables import RunnableConfig
 
@@ -26,6 +38,20 @@ from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
 
 logger = logging.getLogger(__name__)
 
+# number of locks that MemorySaver stripes thread IDs across
+LOCK_STRIPES = 64
+
+# metadata keys indexed by MemorySaver to narrow down filtered list() calls
+INDEXED_METADATA_KEYS = ("source", "step")
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
 
 class MemorySaver(
     BaseCheckpointSaver[str], AbstractContextManager, AbstractAsyncContextManager
@@ -33,6 +59,8 @@ class MemorySaver(
     """An in-memory checkpoint saver.
 
     This checkpoint saver stores checkpoints in memory using a defaultdict.
+    Channel values are stored once per channel version and shared between
+    the checkpoints that reference them.
 
     Note:
         Only use `MemorySaver` for debugging or testing purposes.
@@ -60,6 +88,8 @@ class MemorySaver(
     """
 
     # thread ID ->  checkpoint NS -> checkpoint ID -> checkpoint mapping
+    # (put() keeps checkpoint IDs in ascending order within each namespace,
+    # namespaces that were also written to directly are sorted on read)
     storage: defaultdict[
         str,
         dict[
@@ -69,6 +99,15 @@ class MemorySaver(
     writes: defaultdict[
         tuple[str, str, str], dict[tuple[str, int], tuple[str, str, tuple[str, bytes]]]
     ]
+    # (thread ID, checkpoint NS, channel, version) -> serialized channel value
+    # (shared by all checkpoints in which the channel has that version)
+    blobs: dict[tuple[str, str, str, Union[str, int, float]], tuple[str, bytes]]
+    # (thread ID, checkpoint NS) -> number of checkpoints written through put()
+    _put_size: defaultdict[tuple[str, str], int]
+    # (thread ID, checkpoint NS) -> (metadata key, value) -> checkpoint IDs
+    _metadata_index: defaultdict[
+        tuple[str, str], defaultdict[tuple[str, Any], set[str]]
+    ]
 
     def __init__(
         self,
@@ -79,10 +118,15 @@ class MemorySaver(
         super().__init__(serde=serde)
         self.storage = factory(lambda: defaultdict(dict))
         self.writes = factory(dict)
+        self.blobs = factory()
+        self._put_size = defaultdict(int)
+        self._metadata_index = defaultdict(lambda: defaultdict(set))
+        self._locks = [threading.RLock() for _ in range(LOCK_STRIPES)]
         self.stack = ExitStack()
         if factory is not defaultdict:
             self.stack.enter_context(self.storage)  # type: ignore[arg-type]
             self.stack.enter_context(self.writes)  # type: ignore[arg-type]
+            self.stack.enter_context(self.blobs)  # type: ignore[arg-type]
 
     def __enter__(self) -> "MemorySaver":
         return self.stack.__enter__()
@@ -106,6 +150,18 @@ class MemorySaver(
     ) -> Optional[bool]:
         return self.stack.__exit__(__exc_type, __exc_value, __traceback)
 
+    def _lock(self, thread_id: str) -> AbstractContextManager:
+        # stripe locks by thread ID so that writes to different threads
+        # don't contend with each other
+        return self._locks[hash(thread_id) % LOCK_STRIPES]
+
+    def _written_by_put(
+        self, thread_id: str, checkpoint_ns: str, checkpoints: dict[str, Any]
+    ) -> bool:
+        # every checkpoint in the namespace went through put(), so it is sorted
+        # and fully covered by the metadata index
+        return self._put_size.get((thread_id, checkpoint_ns), 0) == len(checkpoints)
+
     def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the in-memory storage.
 
@@ -122,81 +178,89 @@ class MemorySaver(
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
-        if checkpoint_id := get_checkpoint_id(config):
-            if saved := self.storage[thread_id][checkpoint_ns].get(checkpoint_id):
-                checkpoint, metadata, parent_checkpoint_id = saved
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
-                if parent_checkpoint_id:
-                    sends = [
-                        w[2]
-                        for w in self.writes[
-                            (thread_id, checkpoint_ns, parent_checkpoint_id)
-                        ].values()
-                        if w[1] == TASKS
-                    ]
-                else:
-                    sends = []
-                return CheckpointTuple(
-                    config=config,
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                    },
-                    metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v in writes
-                    ],
-                    parent_config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": parent_checkpoint_id,
+        with self._lock(thread_id):
+            if checkpoint_id := get_checkpoint_id(config):
+                if saved := self.storage[thread_id][checkpoint_ns].get(checkpoint_id):
+                    checkpoint, metadata, parent_checkpoint_id = saved
+                    writes = self.writes.get(
+                        (thread_id, checkpoint_ns, checkpoint_id), {}
+                    ).values()
+                    if parent_checkpoint_id:
+                        sends = [
+                            w[2]
+                            for w in self.writes.get(
+                                (thread_id, checkpoint_ns, parent_checkpoint_id), {}
+                            ).values()
+                            if w[1] == TASKS
+                        ]
+                    else:
+                        sends = []
+                    return CheckpointTuple(
+                        config=config,
+                        checkpoint=self._load_checkpoint(
+                            thread_id, checkpoint_ns, checkpoint, sends
+                        ),
+                        metadata=self.serde.loads_typed(metadata),
+                        pending_writes=[
+                            (id, c, self.serde.loads_typed(v)) for id, c, v in writes
+                        ],
+                        parent_config={
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
                         }
-                    }
-                    if parent_checkpoint_id
-                    else None,
-                )
-        else:
-            if checkpoints := self.storage[thread_id][checkpoint_ns]:
-                checkpoint_id = max(checkpoints.keys())
-                checkpoint, metadata, parent_checkpoint_id = checkpoints[checkpoint_id]
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
-                if parent_checkpoint_id:
-                    sends = [
-                        w[2]
-                        for w in self.writes[
-                            (thread_id, checkpoint_ns, parent_checkpoint_id)
-                        ].values()
-                        if w[1] == TASKS
+                        if parent_checkpoint_id
+                        else None,
+                    )
+            else:
+                if checkpoints := self.storage[thread_id][checkpoint_ns]:
+                    if self._written_by_put(thread_id, checkpoint_ns, checkpoints):
+                        checkpoint_id = next(reversed(checkpoints))
+                    else:
+                        checkpoint_id = max(checkpoints.keys())
+                    checkpoint, metadata, parent_checkpoint_id = checkpoints[
+                        checkpoint_id
                     ]
-                else:
-                    sends = []
-                return CheckpointTuple(
-                    config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": checkpoint_id,
-                        }
-                    },
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                    },
-                    metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v in writes
-                    ],
-                    parent_config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": parent_checkpoint_id,
+                    writes = self.writes.get(
+                        (thread_id, checkpoint_ns, checkpoint_id), {}
+                    ).values()
+                    if parent_checkpoint_id:
+                        sends = [
+                            w[2]
+                            for w in self.writes.get(
+                                (thread_id, checkpoint_ns, parent_checkpoint_id), {}
+                            ).values()
+                            if w[1] == TASKS
+                        ]
+                    else:
+                        sends = []
+                    return CheckpointTuple(
+                        config={
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": checkpoint_id,
+                            }
+                        },
+                        checkpoint=self._load_checkpoint(
+                            thread_id, checkpoint_ns, checkpoint, sends
+                        ),
+                        metadata=self.serde.loads_typed(metadata),
+                        pending_writes=[
+                            (id, c, self.serde.loads_typed(v)) for id, c, v in writes
+                        ],
+                        parent_config={
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
                         }
-                    }
-                    if parent_checkpoint_id
-                    else None,
-                )
+                        if parent_checkpoint_id
+                        else None,
+                    )
 
     def list(
         self,
@@ -220,68 +284,111 @@ class MemorySaver(
         Yields:
             Iterator[CheckpointTuple]: An iterator of matching checkpoint tuples.
         """
-        thread_ids = (config["configurable"]["thread_id"],) if config else self.storage
+        thread_ids = (
+            (config["configurable"]["thread_id"],) if config else list(self.storage)
+        )
         config_checkpoint_ns = (
             config["configurable"].get("checkpoint_ns") if config else None
         )
         config_checkpoint_id = get_checkpoint_id(config) if config else None
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
+        if limit is not None and limit <= 0:
+            return
+        indexed_filter = (
+            [
+                (query_key, query_value)
+                for query_key, query_value in filter.items()
+                if query_key in INDEXED_METADATA_KEYS and _is_hashable(query_value)
+            ]
+            if filter
+            else None
+        )
+        if filter:
+            # extract all filter keys from metadata in a single call and compare
+            # the result against the filter values
+            get_filter_values = operator.itemgetter(*filter)
+            filter_values = (
+                tuple(filter.values())
+                if len(filter) > 1
+                else next(iter(filter.values()))
+            )
         for thread_id in thread_ids:
-            for checkpoint_ns in self.storage[thread_id].keys():
+            lock = self._lock(thread_id)
+            with lock:
+                checkpoint_nss = list(self.storage[thread_id])
+            for checkpoint_ns in checkpoint_nss:
                 if (
                     config_checkpoint_ns is not None
                     and checkpoint_ns != config_checkpoint_ns
                 ):
                     continue
 
+                # snapshot the namespace under the lock, then deserialize and
+                # yield results without holding it
+                with lock:
+                    checkpoints = self.storage[thread_id][checkpoint_ns]
+                    written_by_put = self._written_by_put(
+                        thread_id, checkpoint_ns, checkpoints
+                    )
+                    if indexed_filter and written_by_put:
+                        # narrow down to candidates using the metadata index,
+                        # remaining filter keys are checked below
+                        index = self._metadata_index[(thread_id, checkpoint_ns)]
+                        candidate_ids = set.intersection(
+                            *(index.get(key, set()) for key in indexed_filter)
+                        )
+                        items = [
+                            (checkpoint_id, checkpoints[checkpoint_id])
+                            for checkpoint_id in sorted(candidate_ids, reverse=True)
+                        ]
+                    elif written_by_put:
+                        items = list(reversed(checkpoints.items()))
+                    else:
+                        items = sorted(checkpoints.items(), reverse=True)
+
                 for checkpoint_id, (
                     checkpoint,
                     metadata_b,
                     parent_checkpoint_id,
-                ) in sorted(
-                    self.storage[thread_id][checkpoint_ns].items(),
-                    key=lambda x: x[0],
-                    reverse=True,
-                ):
+                ) in items:
                     # filter by checkpoint ID from config
                     if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
                         continue
 
                     # filter by checkpoint ID from `before` config
-                    if (
-                        before
-                        and (before_checkpoint_id := get_checkpoint_id(before))
-                        and checkpoint_id >= before_checkpoint_id
-                    ):
+                    if before_checkpoint_id and checkpoint_id >= before_checkpoint_id:
                         continue
 
                     # filter by metadata
                     metadata = self.serde.loads_typed(metadata_b)
-                    if filter and not all(
-                        query_value == metadata.get(query_key)
-                        for query_key, query_value in filter.items()
-                    ):
-                        continue
-
-                    # limit search results
-                    if limit is not None and limit <= 0:
-                        break
-                    elif limit is not None:
-                        limit -= 1
-
-                    writes = self.writes[
-                        (thread_id, checkpoint_ns, checkpoint_id)
-                    ].values()
-
-                    if parent_checkpoint_id:
-                        sends = [
-                            w[2]
-                            for w in self.writes[
-                                (thread_id, checkpoint_ns, parent_checkpoint_id)
-                            ].values()
-                            if w[1] == TASKS
-                        ]
-                    else:
-                        sends = []
+                    if filter:
+                        try:
+                            matches = get_filter_values(metadata) == filter_values
+                        except KeyError:
+                            # missing keys match a filter value of None
+                            matches = all(
+                                query_value == metadata.get(query_key)
+                                for query_key, query_value in filter.items()
+                            )
+                        if not matches:
+                            continue
+
+                    with lock:
+                        writes = list(
+                            self.writes.get(
+                                (thread_id, checkpoint_ns, checkpoint_id), {}
+                            ).values()
+                        )
+                        if parent_checkpoint_id:
+                            sends = [
+                                w[2]
+                                for w in self.writes.get(
+                                    (thread_id, checkpoint_ns, parent_checkpoint_id), {}
+                                ).values()
+                                if w[1] == TASKS
+                            ]
+                        else:
+                            sends = []
 
                     yield CheckpointTuple(
                         config={
@@ -291,10 +398,9 @@ class MemorySaver(
                                 "checkpoint_id": checkpoint_id,
                             }
                         },
-                        checkpoint={
-                            **self.serde.loads_typed(checkpoint),
-                            "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                        },
+                        checkpoint=self._load_checkpoint(
+                            thread_id, checkpoint_ns, checkpoint, sends
+                        ),
                         metadata=metadata,
                         parent_config={
                             "configurable": {
@@ -310,6 +416,12 @@ class MemorySaver(
                         ],
                     )
 
+                    # limit search results
+                    if limit is not None:
+                        limit -= 1
+                        if limit <= 0:
+                            return
+
     def put(
         self,
         config: RunnableConfig,
@@ -333,17 +445,45 @@ class MemorySaver(
         """
         c = checkpoint.copy()
         c.pop("pending_sends")  # type: ignore[misc]
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        self.storage[thread_id][checkpoint_ns].update(
-            {
-                checkpoint["id"]: (
-                    self.serde.dumps_typed(c),
-                    self.serde.dumps_typed(metadata),
-                    config["configurable"].get("checkpoint_id"),  # parent
-                )
-            }
+        # only serialize channel versions that aren't stored yet, unchanged
+        # channels keep pointing at the blob written by an earlier checkpoint
+        blobs = [
+            (
+                key,
+                self.serde.dumps_typed(values[k]) if k in values else ("empty", b""),
+            )
+            for k, v in c["channel_versions"].items()
+            if (key := (thread_id, checkpoint_ns, k, v)) not in self.blobs
+        ]
+        saved = (
+            self.serde.dumps_typed(c),
+            self.serde.dumps_typed(metadata),
+            config["configurable"].get("checkpoint_id"),  # parent
         )
+        with self._lock(thread_id):
+            for key, blob in blobs:
+                self.blobs[key] = blob
+            checkpoints = self.storage[thread_id][checkpoint_ns]
+            last_checkpoint_id = next(reversed(checkpoints), None)
+            if checkpoint["id"] not in checkpoints:
+                self._put_size[(thread_id, checkpoint_ns)] += 1
+            self._index_metadata(
+                thread_id,
+                checkpoint_ns,
+                checkpoint["id"],
+                metadata,
+                checkpoints.get(checkpoint["id"]),
+            )
+            checkpoints[checkpoint["id"]] = saved
+            # checkpoint IDs are monotonically increasing, so appending keeps the
+            # namespace sorted; only re-sort if an older ID was inserted
+            if last_checkpoint_id is not None and checkpoint["id"] < last_checkpoint_id:
+                ordered = sorted(checkpoints.items())
+                checkpoints.clear()
+                checkpoints.update(ordered)
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -352,6 +492,56 @@ class MemorySaver(
             }
         }
 
+    def _load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        saved: tuple[str, bytes],
+        sends: List[Tuple[str, bytes]],
+    ) -> Checkpoint:
+        checkpoint = self.serde.loads_typed(saved)
+        if "channel_values" in checkpoint:
+            # written to storage directly rather than through put()
+            channel_values = checkpoint["channel_values"]
+        else:
+            channel_values = self._load_blobs(
+                thread_id, checkpoint_ns, checkpoint["channel_versions"]
+            )
+        return {
+            **checkpoint,
+            "channel_values": channel_values,
+            "pending_sends": [self.serde.loads_typed(s) for s in sends],
+        }
+
+    def _load_blobs(
+        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+    ) -> dict[str, Any]:
+        channel_values = {}
+        for k, v in versions.items():
+            blob = self.blobs.get((thread_id, checkpoint_ns, k, v))
+            if blob is not None and blob[0] != "empty":
+                channel_values[k] = self.serde.loads_typed(blob)
+        return channel_values
+
+    def _index_metadata(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        metadata: CheckpointMetadata,
+        saved: Optional[tuple[tuple[str, bytes], tuple[str, bytes], Optional[str]]],
+    ) -> None:
+        index = self._metadata_index[(thread_id, checkpoint_ns)]
+        if saved is not None:
+            # checkpoint is being overwritten, drop its previous entries
+            previous = self.serde.loads_typed(saved[1])
+            for key in INDEXED_METADATA_KEYS:
+                if _is_hashable(value := previous.get(key)):
+                    index[(key, value)].discard(checkpoint_id)
+        for key in INDEXED_METADATA_KEYS:
+            if _is_hashable(value := metadata.get(key)):
+                index[(key, value)].add(checkpoint_id)
+
     def put_writes(
         self,
         config: RunnableConfig,
@@ -375,13 +565,18 @@ class MemorySaver(
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
         checkpoint_id = config["configurable"]["checkpoint_id"]
         outer_key = (thread_id, checkpoint_ns, checkpoint_id)
-        outer_writes_ = self.writes.get(outer_key)
-        for idx, (c, v) in enumerate(writes):
-            inner_key = (task_id, WRITES_IDX_MAP.get(c, idx))
-            if inner_key[1] >= 0 and outer_writes_ and inner_key in outer_writes_:
-                continue
+        with self._lock(thread_id):
+            outer_writes_ = self.writes.get(outer_key)
+            for idx, (c, v) in enumerate(writes):
+                inner_key = (task_id, WRITES_IDX_MAP.get(c, idx))
+                if inner_key[1] >= 0 and outer_writes_ and inner_key in outer_writes_:
+                    continue
 
-            self.writes[outer_key][inner_key] = (task_id, c, self.serde.dumps_typed(v))
+                self.writes[outer_key][inner_key] = (
+                    task_id,
+                    c,
+                    self.serde.dumps_typed(v),
+                )
 
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Asynchronous version of get_tuple.
@@ -409,8 +604,9 @@ class MemorySaver(
     ) -> AsyncIterator[CheckpointTuple]:
         """Asynchronous version of list.
 
-        This method is an asynchronous wrapper around list that runs the synchronous
-        method in a separate thread using asyncio.
+        This method is an asynchronous wrapper around list. Checkpoints are read
+        from memory, so items are yielded directly rather than fetched one by one
+        in a separate thread.
 
         Args:
             config (RunnableConfig): The config to use for listing the checkpoints.
@@ -418,24 +614,8 @@ class MemorySaver(
         Yields:
             AsyncIterator[CheckpointTuple]: An asynchronous iterator of checkpoint tuples.
         """
-        loop = asyncio.get_running_loop()
-        iter = await loop.run_in_executor(
-            None,
-            partial(
-                self.list,
-                before=before,
-                limit=limit,
-                filter=filter,
-            ),
-            config,
-        )
-        while True:
-            # handling StopIteration exception inside coroutine won't work
-            # as expected, so using next() with default value to break the loop
-            if item := await loop.run_in_executor(None, next, iter, None):
-                yield item
-            else:
-                break
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
 
     async def aput(
         self,
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
@@ -99,7 +100,14 @@ class TestMemorySaver:
             search_results_5[1].config["configurable"]["checkpoint_ns"],
         } == {"", "inner"}
 
-        # TODO: test before and limit params
+        # search with limit (stops after the first match across namespaces)
+        search_results_6 = list(
+            self.memory_saver.list({"configurable": {"thread_id": "thread-2"}}, limit=1)
+        )
+        assert len(search_results_6) == 1
+
+        search_results_7 = list(self.memory_saver.list(None, limit=0))
+        assert len(search_results_7) == 0
 
     async def test_asearch(self) -> None:
         # set up test
@@ -138,3 +146,154 @@ class TestMemorySaver:
             c async for c in self.memory_saver.alist(None, filter=query_4)
         ]
         assert len(search_results_4) == 0
+
+    def test_list_order(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+        }
+        # save checkpoints out of order
+        for checkpoint_id in ["2", "3", "1"]:
+            self.memory_saver.put(
+                config, {**empty_checkpoint(), "id": checkpoint_id}, {}, {}
+            )
+
+        # newest checkpoint is returned first
+        search_results = list(self.memory_saver.list(config))
+        assert [c.config["configurable"]["checkpoint_id"] for c in search_results] == [
+            "3",
+            "2",
+            "1",
+        ]
+
+        before: RunnableConfig = {"configurable": {"checkpoint_id": "3"}}
+        search_results = list(self.memory_saver.list(config, before=before, limit=1))
+        assert [c.config["configurable"]["checkpoint_id"] for c in search_results] == [
+            "2"
+        ]
+
+        latest = self.memory_saver.get_tuple(config)
+        assert latest is not None
+        assert latest.config["configurable"]["checkpoint_id"] == "3"
+
+    def test_search_metadata_index(self) -> None:
+        self.memory_saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+        self.memory_saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+        search_results = list(
+            self.memory_saver.list(None, filter={"source": "loop", "step": 1})
+        )
+        assert [c.metadata for c in search_results] == [self.metadata_2]
+
+        # overwriting a checkpoint replaces its indexed metadata
+        self.memory_saver.put(
+            self.config_2, self.chkpnt_2, {**self.metadata_2, "source": "update"}, {}
+        )
+        assert not list(self.memory_saver.list(None, filter={"source": "loop"}))
+        search_results = list(
+            self.memory_saver.list(None, filter={"source": "update", "step": 1})
+        )
+        assert len(search_results) == 1
+
+        # checkpoints written directly to storage are still found
+        self.memory_saver.storage["thread-3"][""]["3"] = (
+            self.memory_saver.serde.dumps_typed(self.chkpnt_3),
+            self.memory_saver.serde.dumps_typed(self.metadata_1),
+            None,
+        )
+        search_results = list(self.memory_saver.list(None, filter={"source": "input"}))
+        assert len(search_results) == 2
+
+    def test_direct_storage_writes_out_of_order(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+        }
+        for checkpoint_id in ["2", "3"]:
+            self.memory_saver.put(
+                config, {**empty_checkpoint(), "id": checkpoint_id}, {}, {}
+            )
+        # subclasses may write to storage directly, without keeping it sorted
+        self.memory_saver.storage["thread-1"][""]["1"] = (
+            self.memory_saver.serde.dumps_typed({**empty_checkpoint(), "id": "1"}),
+            self.memory_saver.serde.dumps_typed({}),
+            None,
+        )
+
+        latest = self.memory_saver.get_tuple(config)
+        assert latest is not None
+        assert latest.config["configurable"]["checkpoint_id"] == "3"
+
+        search_results = list(self.memory_saver.list(config))
+        assert [c.config["configurable"]["checkpoint_id"] for c in search_results] == [
+            "3",
+            "2",
+            "1",
+        ]
+
+    def test_concurrent_put_and_list(self) -> None:
+        def put_checkpoints(thread_id: str) -> None:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+            }
+            for i in range(50):
+                config = self.memory_saver.put(
+                    config, {**empty_checkpoint(), "id": f"{i:03}"}, {"step": i}, {}
+                )
+                self.memory_saver.put_writes(config, [("foo", i)], "task")
+                list(self.memory_saver.list(None, limit=10))
+
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(put_checkpoints, [f"thread-{i}" for i in range(8)]))
+
+        assert len(list(self.memory_saver.list(None))) == 8 * 50
+
+    def test_reads_do_not_create_writes(self) -> None:
+        self.memory_saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+        config = self.memory_saver.put(
+            self.config_2, self.chkpnt_2, self.metadata_2, {}
+        )
+
+        # the checkpoint has a parent, so its pending sends are looked up too
+        assert self.memory_saver.get_tuple(config) is not None
+        assert len(list(self.memory_saver.list(None))) == 2
+        assert not self.memory_saver.writes
+
+    def test_channel_values_shared_across_checkpoints(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+        }
+        chkpnt_1: Checkpoint = {
+            **empty_checkpoint(),
+            "id": "1",
+            "channel_values": {"foo": "a", "bar": [1, 2]},
+            "channel_versions": {"foo": 1, "bar": 1},
+        }
+        chkpnt_2: Checkpoint = {
+            **chkpnt_1,
+            "id": "2",
+            "channel_values": {"foo": "b", "bar": [1, 2]},
+            "channel_versions": {"foo": 2, "bar": 1},
+        }
+        config = self.memory_saver.put(config, chkpnt_1, {}, {"foo": 1, "bar": 1})
+        self.memory_saver.put(config, chkpnt_2, {}, {"foo": 2})
+
+        # the unchanged channel is only stored once
+        assert len(self.memory_saver.blobs) == 3
+
+        search_results = list(self.memory_saver.list(None))
+        assert [c.checkpoint["channel_values"] for c in search_results] == [
+            {"foo": "b", "bar": [1, 2]},
+            {"foo": "a", "bar": [1, 2]},
+        ]
+
+    def test_search_missing_metadata_key(self) -> None:
+        self.memory_saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+        self.memory_saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+        self.memory_saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+
+        # a filter value of None also matches checkpoints without that key
+        search_results = list(self.memory_saver.list(None, filter={"score": None}))
+        assert len(search_results) == 2
+        search_results = list(
+            self.memory_saver.list(None, filter={"score": None, "source": "loop"})
+        )
+        assert [c.metadata for c in search_results] == [self.metadata_2]
@@ -7,6 +7,7 @@ from copy import copy
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     Dict,
     List,
@@ -38,6 +39,7 @@ from langchain_core.tools.base import get_all_basemodel_annotations
 from typing_extensions import Annotated, get_args, get_origin
 
 from langgraph.errors import GraphInterrupt
+from langgraph.pregel.executor import gated
 from langgraph.store.base import BaseStore
 from langgraph.utils.runnable import RunnableCallable
 
@@ -195,6 +197,8 @@ class ToolNode(RunnableCallable):
     ) -> None:
         super().__init__(self._func, self._afunc, name=name, tags=tags, trace=False)
         self.tools_by_name: Dict[str, BaseTool] = {}
+        self._invoke_by_name: Dict[str, Callable[..., Any]] = {}
+        self._ainvoke_by_name: Dict[str, Callable[..., Awaitable[Any]]] = {}
         self.tool_to_state_args: Dict[str, Dict[str, Optional[str]]] = {}
         self.tool_to_store_arg: Dict[str, Optional[str]] = {}
         self.handle_tool_errors = handle_tool_errors
@@ -203,8 +207,11 @@ class ToolNode(RunnableCallable):
             if not isinstance(tool_, BaseTool):
                 tool_ = create_tool(tool_)
             self.tools_by_name[tool_.name] = tool_
+            self._invoke_by_name[tool_.name] = tool_.invoke
+            self._ainvoke_by_name[tool_.name] = tool_.ainvoke
             self.tool_to_state_args[tool_.name] = _get_state_args(tool_)
             self.tool_to_store_arg[tool_.name] = _get_store_arg(tool_)
+        self._available_tools_str = ", ".join(self.tools_by_name)
 
     def _func(
         self,
@@ -218,9 +225,17 @@ class ToolNode(RunnableCallable):
         store: BaseStore,
     ) -> Any:
         tool_calls, output_type = self._parse_input(input, store)
-        config_list = get_config_list(config, len(tool_calls))
-        with get_executor_for_config(config) as executor:
-            outputs = [*executor.map(self._run_one, tool_calls, config_list)]
+        if len(tool_calls) == 1:
+            # no need to spin up an executor for a single tool call
+            outputs = [self._run_one(tool_calls[0], config)]
+        else:
+            if config.get("run_id") is None:
+                # nothing to strip per call, so all calls can share the config
+                config_list = [config] * len(tool_calls)
+            else:
+                config_list = get_config_list(config, len(tool_calls))
+            with get_executor_for_config(config) as executor:
+                outputs = list(executor.map(self._run_one, tool_calls, config_list))
         # TypedDict, pydantic, dataclass, etc. should all be able to load from dict
         return outputs if output_type == "list" else {self.messages_key: outputs}
 
@@ -250,21 +265,27 @@ class ToolNode(RunnableCallable):
         store: BaseStore,
     ) -> Any:
         tool_calls, output_type = self._parse_input(input, store)
-        outputs = await asyncio.gather(
-            *(self._arun_one(call, config) for call in tool_calls)
-        )
+        if len(tool_calls) == 1:
+            outputs = [await self._arun_one(tool_calls[0], config)]
+        else:
+            coros = [self._arun_one(call, config) for call in tool_calls]
+            if max_concurrency := config.get("max_concurrency"):
+                # bound parallel tool calls, as the sync executor does
+                semaphore = asyncio.Semaphore(max_concurrency)
+                coros = [gated(semaphore, coro) for coro in coros]
+            outputs = await asyncio.gather(*coros)
         # TypedDict, pydantic, dataclass, etc. should all be able to load from dict
         return outputs if output_type == "list" else {self.messages_key: outputs}
 
     def _run_one(self, call: ToolCall, config: RunnableConfig) -> ToolMessage:
-        if invalid_tool_message := self._validate_tool_call(call):
-            return invalid_tool_message
+        if (invoke := self._invoke_by_name.get(call["name"])) is None:
+            return self._invalid_tool_message(call)
 
         try:
-            input = {**call, **{"type": "tool_call"}}
-            tool_message: ToolMessage = self.tools_by_name[call["name"]].invoke(
-                input, config
-            )
+            # calls for known tools are copied in _inject_tool_args, so they
+            # can be updated in place
+            call["type"] = "tool_call"
+            tool_message: ToolMessage = invoke(call, config)
             tool_message.content = cast(
                 Union[str, list], msg_content_output(tool_message.content)
             )
@@ -298,14 +319,14 @@ class ToolNode(RunnableCallable):
         )
 
     async def _arun_one(self, call: ToolCall, config: RunnableConfig) -> ToolMessage:
-        if invalid_tool_message := self._validate_tool_call(call):
-            return invalid_tool_message
+        if (ainvoke := self._ainvoke_by_name.get(call["name"])) is None:
+            return self._invalid_tool_message(call)
 
         try:
-            input = {**call, **{"type": "tool_call"}}
-            tool_message: ToolMessage = await self.tools_by_name[call["name"]].ainvoke(
-                input, config
-            )
+            # calls for known tools are copied in _inject_tool_args, so they
+            # can be updated in place
+            call["type"] = "tool_call"
+            tool_message: ToolMessage = await ainvoke(call, config)
             tool_message.content = cast(
                 Union[str, list], msg_content_output(tool_message.content)
             )
@@ -350,7 +371,7 @@ class ToolNode(RunnableCallable):
         if isinstance(input, list):
             output_type = "list"
             message: AnyMessage = input[-1]
-        elif isinstance(input, dict) and (messages := input.get(self.messages_key, [])):
+        elif isinstance(input, dict) and (messages := input.get(self.messages_key)):
             output_type = "dict"
             message = messages[-1]
         elif messages := getattr(input, self.messages_key, None):
@@ -368,17 +389,15 @@ class ToolNode(RunnableCallable):
         ]
         return tool_calls, output_type
 
-    def _validate_tool_call(self, call: ToolCall) -> Optional[ToolMessage]:
-        if (requested_tool := call["name"]) not in self.tools_by_name:
-            content = INVALID_TOOL_NAME_ERROR_TEMPLATE.format(
-                requested_tool=requested_tool,
-                available_tools=", ".join(self.tools_by_name.keys()),
-            )
-            return ToolMessage(
-                content, name=requested_tool, tool_call_id=call["id"], status="error"
-            )
-        else:
-            return None
+    def _invalid_tool_message(self, call: ToolCall) -> ToolMessage:
+        requested_tool = call["name"]
+        content = INVALID_TOOL_NAME_ERROR_TEMPLATE.format(
+            requested_tool=requested_tool,
+            available_tools=self._available_tools_str,
+        )
+        return ToolMessage(
+            content, name=requested_tool, tool_call_id=call["id"], status="error"
+        )
 
     def _inject_state(
         self,
@@ -516,13 +535,13 @@ def tools_condition(
     """
     if isinstance(state, list):
         ai_message = state[-1]
-    elif isinstance(state, dict) and (messages := state.get(messages_key, [])):
+    elif isinstance(state, dict) and (messages := state.get(messages_key)):
         ai_message = messages[-1]
-    elif messages := getattr(state, messages_key, []):
+    elif messages := getattr(state, messages_key, None):
         ai_message = messages[-1]
     else:
         raise ValueError(f"No messages found in input state to tool_edge: {state}")
-    if hasattr(ai_message, "tool_calls") and len(ai_message.tool_calls) > 0:
+    if getattr(ai_message, "tool_calls", None):
         return "tools"
     return "__end__"
 
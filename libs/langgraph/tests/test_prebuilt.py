@@ -1,3 +1,4 @@
+import asyncio
 import dataclasses
 import json
 from functools import partial
@@ -906,6 +907,39 @@ def test_tool_node_incorrect_tool_name():
     assert tool_message.tool_call_id == "some 0"
 
 
+async def test_tool_node_max_concurrency():
+    running = 0
+    max_running = 0
+
+    @dec_tool
+    async def slow_tool(some_val: int) -> str:
+        """Tool that sleeps."""
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"{some_val}"
+
+    result = await ToolNode([slow_tool]).ainvoke(
+        {
+            "messages": [
+                AIMessage(
+                    "hi?",
+                    tool_calls=[
+                        {"name": "slow_tool", "args": {"some_val": i}, "id": f"{i}"}
+                        for i in range(5)
+                    ],
+                )
+            ]
+        },
+        {"max_concurrency": 2, "configurable": {}},
+    )
+
+    assert [m.content for m in result["messages"]] == ["0", "1", "2", "3", "4"]
+    assert max_running == 2
+
+
 def test_tool_node_node_interrupt():
     def tool_normal(some_val: int) -> str:
         """Tool docstring."""